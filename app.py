@@ -1,7 +1,10 @@
 import streamlit as st
 import numpy as np
-import matplotlib.pyplot as plt
 import matplotlib.patches as patches
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+from solvers import solve_linear
 
 # ---- Page setup ----
 st.set_page_config(page_title="Gaming Platform Simulator", layout="wide")
@@ -34,6 +37,7 @@ MAX_Q = 2000   # max quantity for x-axis
 MAX_P = 60     # max price for y-axis
 
 # ---- Placeholders for plots & KPIs at the top ----
+notice_placeholder = st.empty()  # full-width, used when there is nothing to plot
 plot_col1, plot_col2 = st.columns(2)
 plotA_placeholder = plot_col1.empty()
 plotB_placeholder = plot_col2.empty()
@@ -78,48 +82,35 @@ with controls:
                         0.0, 50.0, 20.0, 1.0,
                         help="Listing fees, commission, or equivalent monthly charge per developer/game.")
 
-# ---- Linear demand solver ----
-def solve_demand(a_A, b_A, a_B, b_B, gamma_A, gamma_B, p_A, p_B):
-    """
-    Linear system:
-    Q_A = a_A - b_A * p_A + γ_A * Q_B
-    Q_B = a_B - b_B * p_B + γ_B * Q_A
-    """
-    A = np.array([[1, -gamma_A],
-                  [-gamma_B, 1]])
-    B = np.array([a_A - b_A * p_A,
-                  a_B - b_B * p_B])
-    Q_A, Q_B = np.linalg.solve(A, B)
-    return max(Q_A, 0.0), max(Q_B, 0.0)
-
-# ---- Compute equilibrium quantities and revenues given sliders ----
-Q_A, Q_B = solve_demand(a_A, b_A, a_B, b_B, gamma_A, gamma_B, p_A, p_B)
-R_A = p_A * Q_A
-R_B = p_B * Q_B
-
 # ---- Prepare linear demand curves (P as function of Q) ----
-Q_range = np.linspace(0, MAX_Q, 200)
-
-# P_A(Q) = (a_A + γ_A * Q_B - Q)/b_A  (capped at >= 0)
-P_A_curve = np.maximum(0, (a_A + gamma_A * Q_B - Q_range) / b_A)
+def build_demand_curve(a, b, gamma, Q_other):
+    """
+    Inverse demand on one side, capped at >= 0:
+    P(Q) = (a + γ * Q_other - Q)/b
 
-# P_B(Q) = (a_B + γ_B * Q_A - Q)/b_B
-P_B_curve = np.maximum(0, (a_B + gamma_B * Q_A - Q_range) / b_B)
+    The curve is piecewise linear, so it is returned as its exact vertices
+    (Q, P): Q = 0, the kink where P reaches 0 (clipped to the axis) and MAX_Q.
+    """
+    Q_kink = min(max(a + gamma * Q_other, 0.0), MAX_Q)
+    Q = np.array([0.0, Q_kink, MAX_Q])
+    return Q, np.maximum(0, (a + gamma * Q_other - Q) / b)
 
 # With the chosen defaults (a_, b_, γ_), the *full* linear line for both sides
 # lies inside [0, MAX_Q] × [0, MAX_P] in the default setting.
 
-# ---- Helper for drawing each panel ----
-def draw_panel(Q_curve, Q_star, P_star, title):
-    fig, ax = plt.subplots(figsize=(5.2, 3.4))
+# ---- Panel setup: static parts are built once per axes ----
+def init_panel(ax, title):
+    """
+    Build the static parts of a panel: fixed axes, labels, the demand line,
+    the revenue rectangle and the operating-point marker. Reruns only update
+    data, through the (line, rect, point) artists returned here.
+    """
     # Demand curve
-    ax.plot(Q_range, Q_curve, color="black", linewidth=1.8)
+    line, = ax.plot([0, MAX_Q], [0, 0], color="black", linewidth=1.8)
 
     # Revenue rectangle (from (0,0) to (Q*,P*))
     rect = patches.Rectangle(
-        (0, 0),
-        min(Q_star, MAX_Q),
-        min(P_star, MAX_P),
+        (0, 0), 0, 0,
         facecolor='orange',
         alpha=0.35,
         edgecolor='black',
@@ -127,9 +118,8 @@ def draw_panel(Q_curve, Q_star, P_star, title):
     )
     ax.add_patch(rect)
 
-    # Mark the operating point (Q*, P*)
-    ax.scatter(min(Q_star, MAX_Q), min(P_star, MAX_P),
-               color="red", s=60, zorder=3)
+    # Operating point (Q*, P*)
+    point = ax.scatter([0], [0], color="red", s=60, zorder=3)
 
     ax.set_xlim(0, MAX_Q)
     ax.set_ylim(0, MAX_P)
@@ -137,24 +127,67 @@ def draw_panel(Q_curve, Q_star, P_star, title):
     ax.set_ylabel("Price p")
     ax.set_title(title, fontsize=13)
     ax.grid(True, linewidth=0.3, alpha=0.7)
-    fig.tight_layout(pad=0.3)
-    return fig
-
-# ---- Render plots into the placeholders at the TOP ----
-with plotA_placeholder:
-    figA = draw_panel(P_A_curve, Q_A, p_A,
-                      "Side A – Consumers (Players)")
-    st.pyplot(figA, use_container_width=True)
-
-with plotB_placeholder:
-    figB = draw_panel(P_B_curve, Q_B, p_B,
-                      "Side B – Developers")
-    st.pyplot(figB, use_container_width=True)
-
-# ---- KPIs under the plots ----
-kpiA_placeholder.metric("Consumers Q_A (active players)", f"{Q_A:,.1f}")
-kpiB_placeholder.metric("Developers Q_B (active devs/games)", f"{Q_B:,.1f}")
-kpiR_placeholder.metric("Total platform revenue R_A + R_B", f"{(R_A + R_B):,.1f} €")
+    return line, rect, point
+
+# ---- One persistent figure per panel and session ----
+# Kept in session_state rather than st.cache_resource: the artists are mutated
+# on every rerun, so concurrent sessions must not share them.
+def get_panel(title):
+    state_key = f"panel:{title}"
+    if state_key not in st.session_state:
+        # Plain Figure on an Agg canvas: stays out of pyplot's global figure manager
+        fig = Figure(figsize=(5.2, 3.4))
+        FigureCanvasAgg(fig)
+        artists = init_panel(fig.add_subplot(), title)
+        fig.tight_layout(pad=0.3)
+        st.session_state[state_key] = (fig, artists)
+    return st.session_state[state_key]
+
+# ---- Helper for updating each panel ----
+def draw_panel(artists, curve, Q_star, P_star):
+    line, rect, point = artists
+    line.set_data(*curve)
+    rect.set_bounds(0, 0, min(Q_star, MAX_Q), min(P_star, MAX_P))
+    point.set_offsets([[min(Q_star, MAX_Q), min(P_star, MAX_P)]])
+
+# ---- Compute equilibrium quantities and revenues given sliders ----
+equilibrium = solve_linear(a_A, b_A, a_B, b_B, gamma_A, gamma_B, p_A, p_B)
+
+if equilibrium is None:
+    # No operating point to draw – don't show one
+    notice_placeholder.warning(
+        "No finite equilibrium for γ_A·γ_B = 1: each side's growth keeps "
+        "attracting more of the other. Lower γ_A or γ_B."
+    )
+    kpiA_placeholder.metric("Consumers Q_A (active players)", "—")
+    kpiB_placeholder.metric("Developers Q_B (active devs/games)", "—")
+    kpiR_placeholder.metric("Total platform revenue R_A + R_B", "—")
+else:
+    Q_A, Q_B = equilibrium
+    R_A = p_A * Q_A
+    R_B = p_B * Q_B
+
+    # P_A(Q) = (a_A + γ_A * Q_B - Q)/b_A
+    curve_A = build_demand_curve(a_A, b_A, gamma_A, Q_B)
+
+    # P_B(Q) = (a_B + γ_B * Q_A - Q)/b_B
+    curve_B = build_demand_curve(a_B, b_B, gamma_B, Q_A)
+
+    # ---- Render plots into the placeholders at the TOP ----
+    with plotA_placeholder:
+        figA, artistsA = get_panel("Side A – Consumers (Players)")
+        draw_panel(artistsA, curve_A, Q_A, p_A)
+        st.pyplot(figA, use_container_width=True)
+
+    with plotB_placeholder:
+        figB, artistsB = get_panel("Side B – Developers")
+        draw_panel(artistsB, curve_B, Q_B, p_B)
+        st.pyplot(figB, use_container_width=True)
+
+    # ---- KPIs under the plots ----
+    kpiA_placeholder.metric("Consumers Q_A (active players)", f"{Q_A:,.1f}")
+    kpiB_placeholder.metric("Developers Q_B (active devs/games)", f"{Q_B:,.1f}")
+    kpiR_placeholder.metric("Total platform revenue R_A + R_B", f"{(R_A + R_B):,.1f} €")
 
 st.caption(
     "In the default settings, the *entire* linear demand curve for both sides fits "
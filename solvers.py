@@ -0,0 +1,23 @@
+"""Equilibrium solvers for the two-sided market model."""
+
+
+def solve_linear(a_A, b_A, a_B, b_B, gamma_A, gamma_B, p_A, p_B):
+    """
+    Linear system:
+    Q_A = a_A - b_A * p_A + γ_A * Q_B
+    Q_B = a_B - b_B * p_B + γ_B * Q_A
+
+    Solved in closed form (Cramer's rule) – for a 2×2 system this is far
+    cheaper than dispatching to np.linalg.solve.
+
+    Returns None when γ_A·γ_B = 1: the cross-side effects then feed each
+    other without bound and there is no finite equilibrium.
+    """
+    det = 1.0 - gamma_A * gamma_B
+    if abs(det) < 1e-12:
+        return None
+    b0 = a_A - b_A * p_A
+    b1 = a_B - b_B * p_B
+    Q_A = (b0 + gamma_A * b1) / det
+    Q_B = (gamma_B * b0 + b1) / det
+    return max(Q_A, 0.0), max(Q_B, 0.0)